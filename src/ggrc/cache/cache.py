@@ -193,6 +193,6 @@ class Cache(object):
 
   def is_caching_supported(self, category, resource_name):
     """Check if caching supported for resource."""
-    if category is 'collection':
+    if category == 'collection':
       return resource_name in self.supported_resources
     return False
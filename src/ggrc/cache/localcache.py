@@ -26,7 +26,7 @@ class LocalCache(Cache):
     self.name = 'local'
 
     for cache_entry in all_cache_entries():
-      if cache_entry.cache_type is self.name:
+      if cache_entry.cache_type == self.name:
         self.supported_resources[cache_entry.model_plural] = \
             cache_entry.class_name
 
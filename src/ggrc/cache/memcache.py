@@ -2,9 +2,10 @@
 # Licensed under http://www.apache.org/licenses/LICENSE-2.0 <see LICENSE file>
 """Memcache implements the remote AppEngine Memcache mechanism."""
 
+import itertools
 import logging
+import time
 from collections import OrderedDict
-from copy import deepcopy
 
 from google.appengine.api import memcache
 
@@ -14,6 +15,18 @@ from ggrc import settings
 
 logger = logging.getLogger(__name__)
 
+# Lease taken by a cached function call that calculates missed value.
+# Callers that found the lease taken wait LEASE_WAIT_SECONDS once and then
+# calculate the value themselves if it's still missing, so the lease only
+# protects functions that finish faster than that wait.
+LOCK_SUFFIX = ":__lock__"
+LEASE_SECONDS = 5
+LEASE_WAIT_SECONDS = 0.05
+
+# Client shared by all cached functions. CAS ids are stored per client,
+# so it must not be used for CAS operations (MemCache has its own client).
+_CLIENT = memcache.Client()
+
 
 def has_memcache():
   # type: () -> bool
@@ -28,10 +41,10 @@ class MemCache(cache.Cache):
     self.name = 'memcache'
     self.client = None
     self.memcache_client = memcache.Client()
-    self.supported_resources.update({
-        cache_entry.model_plural: cache_entry.class_name
+    self.supported_resources.update(
+        (cache_entry.model_plural, cache_entry.class_name)
         for cache_entry in cache.all_cache_entries()
-        if cache_entry.cache_type is self.name})
+        if cache_entry.cache_type == self.name)
 
   def get_name(self):
     return self.name
@@ -52,8 +65,6 @@ class MemCache(cache.Cache):
 
     if not self.is_caching_supported(category, resource):
       return None
-    # TODO(dan): use memcache.Client.get_multi() instead of gets()
-    #
     data = OrderedDict()
     cache_key = self.get_key(category, resource)
     if cache_key is None:
@@ -64,23 +75,23 @@ class MemCache(cache.Cache):
     else:
       if ids is None:
         return None
-    for id_ in ids:
-      attrvalues = self.memcache_client.gets(cache_key + ":" + str(id_))
-      if attrvalues is not None:
-        if attrs is None:
-          data[id_] = attrvalues
-        else:
-          attr_dict = OrderedDict()
-          for attr in attrs:
-            if attr in attrvalues:
-              attr_dict[attr] = deepcopy(attrvalues.get(attr))
-          data[id_] = attr_dict
+    keys = [cache_key + ":" + str(id_) for id_ in ids]
+    cached_values = self.memcache_client.get_multi(keys, '', None, True)
+    if not all(key in cached_values for key in keys):
+      # All or None policy is enforced, if one of the objects
+      # is not available in cache, then we return empty
+      # TODO(dan): cannot distinguish network failures vs
+      # id not found in memcache, both scenarios return empty list
+      return None
+    for id_, key in zip(ids, keys):
+      attrvalues = cached_values[key]
+      if attrs is None:
+        data[id_] = attrvalues
       else:
-        # All or None policy is enforced, if one of the objects
-        # is not available in cache, then we return empty
-        # TODO(dan): cannot distinguish network failures vs
-        # id not found in memcache, both scenarios return empty list
-        return None
+        # Values are freshly unpickled by the RPC and owned by the caller,
+        # so they are returned as is. The attrs order is not preserved.
+        data[id_] = {attr: attrvalues[attr]
+                     for attr in attrs if attr in attrvalues}
     return data
 
   def add(self, category, resource, data, expiration_time=0):
@@ -97,37 +108,32 @@ class MemCache(cache.Cache):
     """
     if not self.is_caching_supported(category, resource):
       return None
-    entries = {}
     cache_key = self.get_key(category, resource)
     if cache_key is None:
       return None
-    # TODO(dan): use memcache.Client.add_multi() instead of add()
-    for key in data.keys():
-      cache_key = cache_key + ":" + str(key)
-      cache_data = self.memcache_client.gets(cache_key)
-      if cache_data is None:
-        if self.memcache_client.add(cache_key,
-                                    data.get(key),
-                                    expiration_time) is False:
-          # We stop processing any further
-          # TODO(ggrcdev): Should we throw exceptions
-          # and/or log critical events
-          return None
-        else:
-          entries[key] = data
-      else:
+    full_keys = {cache_key + ":" + str(key): key for key in data}
+    existing = self.memcache_client.get_multi(list(full_keys), '', None, True)
+    to_add = {}
+    to_cas = {}
+    for full_key, key in full_keys.iteritems():
+      if full_key in existing:
         # This could occur on import scenarios
-        #
-        if self.memcache_client.cas(cache_key,
-                                    data.get(key),
-                                    expiration_time) is False:
-          # We stop processing any further
-          # TODO(ggrcdev): Should we throw exceptions
-          # and/or log critical events
-          return None
-        else:
-          entries[key] = data
-    return entries
+        to_cas[full_key] = data.get(key)
+      else:
+        to_add[full_key] = data.get(key)
+    not_stored = []
+    if to_add:
+      not_stored.extend(
+          self.memcache_client.add_multi(to_add, expiration_time))
+    if to_cas:
+      not_stored.extend(
+          self.memcache_client.cas_multi(to_cas, expiration_time))
+    if not_stored:
+      # All or None policy is enforced
+      # TODO(ggrcdev): Should we throw exceptions
+      # and/or log critical events
+      return None
+    return {key: data for key in data}
 
   def update(self, category, resource, data, expiration_time):
     """ Update items from mem cache for specified data
@@ -143,24 +149,22 @@ class MemCache(cache.Cache):
     """
     if not self.is_caching_supported(category, resource):
       return None
-    entries = {}
     cache_key = self.get_key(category, resource)
     if cache_key is None:
       return None
-    # TODO(ggrcdev): use memcache.Client.cas_multi(),
-    # get_multi() instead of cas(), gets()
-    #
-    for key in data.keys():
-      id_ = cache_key + ":" + str(key)
-      if self.memcache_client.cas(id_,
-                                  data.get(key),
-                                  expiration_time) is False:
-        # RPC Error or value is not id is not found in cache.
-        # Cannot proceed further with update (All or None) policy
-        return None
-      else:
-        entries[key] = data
-    return entries
+    # CAS tokens are taken from the preceding get(), which fetches with
+    # for_cas enabled on this client
+    prefixed = {cache_key + ":" + str(key): data.get(key) for key in data}
+    try:
+      not_stored = self.memcache_client.cas_multi(prefixed, expiration_time)
+    except ValueError:
+      # Some ids weren't fetched with get() first, there are no CAS ids
+      return None
+    if not_stored:
+      # RPC Error or some ids are not found in cache.
+      # Cannot proceed further with update (All or None) policy
+      return None
+    return {key: data for key in data}
 
   def remove(self, category, resource, data, lockadd_seconds=0):
     """ delete items from mem cache for specified data
@@ -176,34 +180,16 @@ class MemCache(cache.Cache):
     """
     if not self.is_caching_supported(category, resource):
       return None
-    entries = {}
     cache_key = self.get_key(category, resource)
     if cache_key is None:
       return None
-    # TODO(dan): use memcache.Client.delete_multi(),
-    # get_multi() instead of delete(), gets()
-    #
-    for key in data.keys():
-      id_ = cache_key + ":" + str(key)
-      retvalue = self.memcache_client.delete(id_, lockadd_seconds)
-      # Log the event of delete failures
-      if retvalue == 0:
-        # retvalue of 0 indicates Network failure,
-        # Cannot proceed further with delete (All or None) policy
-        return None
-      elif retvalue == 2:
-        # retvalue of 2 indicates Success
-        entries[key] = data
-      elif retvalue == 1:
-        # retvalue of 1 indicates id_ is not present in memcache
-        # (could be expired), proceed with next entry
-        continue
-      else:
-        # Any other return value,
-        # Cannot proceed further with delete (All or None) policy
-        #
-        return None
-    return entries
+    prefixed = [cache_key + ":" + str(key) for key in data]
+    # delete_multi returns False only on Network failure, entries absent
+    # from memcache (could be expired) are treated as deleted
+    if not self.memcache_client.delete_multi(prefixed, lockadd_seconds):
+      # Cannot proceed further with delete (All or None) policy
+      return None
+    return {key: data for key in data}
 
   def add_multi(self, data, expiration_time=0):
     """ Add multiple entries to memcache
@@ -272,8 +258,9 @@ class _Decorated(object):
   """Decorated class."""
 
   def __init__(self, function):
-    self.memcache_client = memcache.Client()
+    self.memcache_client = _CLIENT
     self.function = function
+    self._prefix = "{}.{}:".format(function.__module__, function.__name__)
 
   @property
   def active(self):
@@ -281,13 +268,13 @@ class _Decorated(object):
     return has_memcache()
 
   def get_key(self, *args, **kwargs):
-    """Return key name for sent args and kwargs"""
-    prefix = "{}.{}".format(self.function.__module__, self.function.__name__)
-    key_args = list(args)
-    for pair in kwargs.iteritems():
-      key_args.extend(pair)
-    suffix = ','.join([str(a) for a in key_args])
-    return "{}:{}".format(prefix, suffix)
+    """Return key name for sent args and kwargs
+
+    Kwargs are sorted by name so the same call always maps to the same key.
+    """
+    key_args = args + tuple(itertools.chain.from_iterable(
+        sorted(kwargs.iteritems())))
+    return self._prefix + ",".join(map(str, key_args))
 
   def __call__(self, *args, **kwargs):
     if not self.active:
@@ -296,10 +283,46 @@ class _Decorated(object):
     value = self.memcache_client.get(key)
     if value is not None:
       return value
-    result = self.function(*args, **kwargs)
-    self.memcache_client.add(key, result)
+    # Only the lease holder calculates the value, concurrent callers wait
+    # for it to avoid stampede of expensive calls on a cold cache
+    lock_key = key + LOCK_SUFFIX
+    if not self.memcache_client.add(lock_key, 1, LEASE_SECONDS):
+      # add also fails on RPC errors, don't wait if lease can't be read back
+      if self.memcache_client.get(lock_key) is not None:
+        time.sleep(LEASE_WAIT_SECONDS)
+      value = self.memcache_client.get(key)
+      if value is not None:
+        return value
+      return self.function(*args, **kwargs)
+    try:
+      result = self.function(*args, **kwargs)
+      self.memcache_client.add(key, result)
+    finally:
+      self.memcache_client.delete(lock_key)
     return result
 
+  def call_multi(self, args_list):
+    """Return list of results of function called with each args tuple.
+
+    Only positional args are supported. Cached values are fetched with
+    a single get_multi call, only missed values are calculated and stored
+    back with add_multi. Cached None is treated as a miss like in __call__.
+    """
+    if not self.active:
+      return [self.function(*args) for args in args_list]
+    keys = [self.get_key(*args) for args in args_list]
+    results = {key: value
+               for key, value in self.memcache_client.get_multi(keys).items()
+               if value is not None}
+    missed = {}
+    for key, args in zip(keys, args_list):
+      if key not in results and key not in missed:
+        missed[key] = self.function(*args)
+    if missed:
+      self.memcache_client.add_multi(missed)
+      results.update(missed)
+    return [results[key] for key in keys]
+
   def invalidate_cache(self, *args, **kwargs):
     """Invalidate cached data."""
     if not self.active:
@@ -297,6 +297,10 @@ class Stateful(object):
   def valid_statuses(cls):
     return cls.VALID_STATES
 
+  def is_valid_status(self, status):
+    """Return True if `status` is valid for self instance."""
+    return status in self.valid_statuses()
+
   @validates('status')
   def validate_status(self, key, value):
     """Use default status if value is None, check that it is in valid set."""
@@ -307,7 +311,7 @@ class Stateful(object):
       value = super(Stateful, self).validate_status(key, value)
     if value is None:
       value = self.default_status()
-    if value not in self.valid_statuses():
+    if not self.is_valid_status(value):
       message = u"Invalid state '{}'".format(value)
       raise ValueError(message)
     return value
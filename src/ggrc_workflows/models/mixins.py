@@ -14,6 +14,11 @@ from ggrc.models import mixins
 from ggrc.models import reflection
 
 
+def _exclude_state(states, state):
+  """Return tuple of `states` without `state`."""
+  return tuple(item for item in states if item != state)
+
+
 class StatusValidatedMixin(mixins.Stateful):
   """Mixin setup statuses for Cycle and CycleTaskGroup."""
 
@@ -23,8 +28,16 @@ class StatusValidatedMixin(mixins.Stateful):
   VERIFIED = u"Verified"
   DEPRECATED = u"Deprecated"
 
-  NO_VALIDATION_STATES = [ASSIGNED, IN_PROGRESS, FINISHED, DEPRECATED]
-  VALID_STATES = NO_VALIDATION_STATES + [VERIFIED]
+  NO_VALIDATION_STATES = (ASSIGNED, IN_PROGRESS, FINISHED, DEPRECATED)
+  VALID_STATES = NO_VALIDATION_STATES + (VERIFIED,)
+
+  _NO_VALIDATION_STATES_SET = frozenset(NO_VALIDATION_STATES)
+  _VALID_STATES_SET = frozenset(VALID_STATES)
+
+  # Active states are all valid states except done_status one
+  _ACTIVE_STATES = _exclude_state(VALID_STATES, VERIFIED)
+  _NO_VALIDATION_ACTIVE_STATES = _exclude_state(NO_VALIDATION_STATES,
+                                                FINISHED)
 
   _api_attrs = reflection.ApiAttributes(
       reflection.Attribute("is_verification_needed",
@@ -45,9 +58,17 @@ class StatusValidatedMixin(mixins.Stateful):
       return self.VALID_STATES
     return self.NO_VALIDATION_STATES
 
+  def is_valid_status(self, status):
+    """Return True if `status` is valid for self instance."""
+    if self.is_verification_needed:
+      return status in self._VALID_STATES_SET
+    return status in self._NO_VALIDATION_STATES_SET
+
   @property
   def active_states(self):
-    return [i for i in self.valid_statuses() if i != self.done_status]
+    if self.is_verification_needed:
+      return self._ACTIVE_STATES
+    return self._NO_VALIDATION_ACTIVE_STATES
 
   @property
   def done_status(self):
@@ -92,16 +113,20 @@ class CycleTaskStatusValidatedMixin(CycleTaskGroupRelatedStatusValidatedMixin):
 
   DECLINED = u"Declined"
 
-  VALID_STATES = CycleTaskGroupRelatedStatusValidatedMixin.VALID_STATES + [
+  VALID_STATES = CycleTaskGroupRelatedStatusValidatedMixin.VALID_STATES + (
       DECLINED,
-  ]
+  )
+
+  _VALID_STATES_SET = frozenset(VALID_STATES)
+  _ACTIVE_STATES = _exclude_state(VALID_STATES, StatusValidatedMixin.VERIFIED)
 
   @property
   def is_overdue(self):
     """Return True if task is overdue."""
-    today = date.today()
-    task_end_date = self.end_date or today
-    return not self.is_done and task_end_date < today
+    end_date = self.end_date
+    # is_done may load cycle relationship, so dates are compared first
+    return (end_date is not None and end_date < date.today() and
+            not self.is_done)
 
   _aliases = {
       "status": {
@@ -126,11 +151,12 @@ class CycleTaskStatusValidatedMixin(CycleTaskGroupRelatedStatusValidatedMixin):
 
 class WorkflowCommentable(comment.Commentable):
   """Mixin for commentable workflow objects."""
-  VALID_RECIPIENTS = frozenset([
-      "Task Assignees",
-      "Task Secondary Assignees"
-  ])
+  _RECIPIENTS = (
+      u"Task Assignees",
+      u"Task Secondary Assignees",
+  )
+  VALID_RECIPIENTS = frozenset(_RECIPIENTS)
   recipients = db.Column(
       db.String,
       nullable=True,
-      default=u"Task Assignees,Task Secondary Assignees")
+      default=u",".join(_RECIPIENTS))
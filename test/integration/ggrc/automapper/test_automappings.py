@@ -28,8 +28,10 @@ def automapping_count_limit(new_limit):
   """Automapping count limit"""
   original_limit = ggrc.automapper.AutomapperGenerator.COUNT_LIMIT
   ggrc.automapper.AutomapperGenerator.COUNT_LIMIT = new_limit
-  yield
-  ggrc.automapper.AutomapperGenerator.COUNT_LIMIT = original_limit
+  try:
+    yield
+  finally:
+    ggrc.automapper.AutomapperGenerator.COUNT_LIMIT = original_limit
 
 
 class TestAutomappings(TestCase):
@@ -9,8 +9,6 @@ from collections import OrderedDict
 import ddt
 import mock
 
-from flask import g
-
 from ggrc import settings
 from ggrc import db
 from ggrc import views
@@ -25,6 +23,7 @@ from ggrc.models.hooks.issue_tracker import issue_tracker_params_builder
 from integration.ggrc import TestCase, generator
 from integration.ggrc.api_helper import Api
 from integration.ggrc.models import factories
+from integration.ggrc.utils import helpers
 
 
 class TestBulkIssuesSync(TestCase):
@@ -283,11 +282,11 @@ class TestBulkIssuesGenerate(TestBulkIssuesSync):
   def test_issue_generate_call(self):
     """Test generate_issue call creates task for bulk generate."""
     user = all_models.Person.query.filter_by(email="user@example.com").one()
-    setattr(g, '_current_user', user)
     data = {
         "revision_ids": [1, 2, 3],
     }
-    result = views.background_update_issues(data)
+    with helpers.logged_user(user):
+      result = views.background_update_issues(data)
 
     self.assert200(result)
     bg_task = all_models.BackgroundTask.query.one()
@@ -12,6 +12,7 @@ from integration.ggrc import api_helper
 from integration.ggrc import TestCase
 from integration.ggrc.access_control import acl_helper
 from integration.ggrc.models import factories
+from integration.ggrc.utils import helpers
 
 
 class TestAssessmentNotification(TestCase):
@@ -139,15 +140,13 @@ class TestAssessmentNotification(TestCase):
           email="user@example.com").first()
       assessment.add_person_with_role_name(user, "Assignees")
 
-    from flask import g
-    setattr(g, '_current_user', user)
-
     import_data = OrderedDict([
         ("object_type", "Assessment"),
         ("Code*", assessment_slug),
         ("Test GCAD", "test value"),
     ])
-    response = self.import_data(import_data)
+    with helpers.logged_user(user):
+      response = self.import_data(import_data)
     self._check_csv_response(response, {})
 
     notifs, _ = common.get_daily_notifications()
@@ -3,17 +3,28 @@
 
 """Module with common helper functions."""
 
+import contextlib
+
 import ddt
+import flask
+
+_MISSING = object()
 
 
 def tuplify(data):
   """Convert dictionary to a list of tuples."""
-  for key, value in data.items():
+  stack = [((), iter(data.items()))]
+  while stack:
+    prefix, items = stack[-1]
+    try:
+      key, value = next(items)
+    except StopIteration:
+      stack.pop()
+      continue
     if isinstance(value, dict):
-      for keykey in tuplify(value):
-        yield (key,) + keykey
+      stack.append((prefix + (key,), iter(value.items())))
     else:
-      yield (key, value)
+      yield prefix + (key, value)
 
 
 def unwrap(data):
@@ -32,3 +43,21 @@ def unwrap(data):
   def wrapper(func):
     return ddt.data(*tuplify(data))(ddt.unpack(func))
   return wrapper
+
+
+@contextlib.contextmanager
+def logged_user(user):
+  """Context manager that sets `user` as current user of flask.g.
+
+  The previous state of flask.g is restored even if wrapped code fails.
+  If no current user was set before, the attribute is removed again.
+  """
+  global_user = getattr(flask.g, "_current_user", _MISSING)
+  setattr(flask.g, "_current_user", user)
+  try:
+    yield
+  finally:
+    if global_user is _MISSING:
+      delattr(flask.g, "_current_user")
+    else:
+      setattr(flask.g, "_current_user", global_user)
@@ -0,0 +1,35 @@
+# Copyright (C) 2019 Google Inc.
+# Licensed under http://www.apache.org/licenses/LICENSE-2.0 <see LICENSE file>
+
+"""Tests for integration test helpers."""
+
+import flask
+
+from integration.ggrc import TestCase
+from integration.ggrc.utils import helpers
+
+
+class TestLoggedUser(TestCase):
+  """Tests for logged_user context manager."""
+
+  def tearDown(self):
+    if hasattr(flask.g, "_current_user"):
+      delattr(flask.g, "_current_user")
+    super(TestLoggedUser, self).tearDown()
+
+  def test_restore_user(self):
+    """Test previously set current user is restored."""
+    setattr(flask.g, "_current_user", "old user")
+    with helpers.logged_user("new user"):
+      self.assertEqual(getattr(flask.g, "_current_user"), "new user")
+    self.assertEqual(getattr(flask.g, "_current_user"), "old user")
+
+  def test_remove_user(self):
+    """Test current user is removed if it wasn't set before."""
+    if hasattr(flask.g, "_current_user"):
+      delattr(flask.g, "_current_user")
+    with self.assertRaises(ValueError):
+      with helpers.logged_user("new user"):
+        self.assertEqual(getattr(flask.g, "_current_user"), "new user")
+        raise ValueError()
+    self.assertFalse(hasattr(flask.g, "_current_user"))
@@ -12,6 +12,39 @@ def get_sub_row_by(rows, **conditions):
   return None
 
 
+def rows_cells(browser, row_class, cell_class, item_class=None,
+               container=None):
+  """Returns a list of rows within `container` (or the whole page). Each row
+  is a list of its cells as dicts with `text` of the cell and `items` texts
+  of cell elements with `item_class`.
+  Texts are read using JS in one call as reading them element by element
+  takes a lot of time.
+  """
+  return browser.execute_script("""
+  var root = arguments[0] || document;
+  var rows = root.getElementsByClassName(arguments[1]);
+  var cell_class = arguments[2];
+  var item_class = arguments[3];
+  var result = [];
+  for (let i = 0; i < rows.length; i++) {
+    let cells = rows[i].getElementsByClassName(cell_class);
+    let row = [];
+    for (let j = 0; j < cells.length; j++) {
+      let items = [];
+      if (item_class) {
+        let item_els = cells[j].getElementsByClassName(item_class);
+        for (let k = 0; k < item_els.length; k++) {
+          items.push(item_els[k].innerText.trim());
+        }
+      }
+      row.push({text: cells[j].innerText.trim(), items: items});
+    }
+    result.push(row);
+  }
+  return result;
+  """, container, row_class, cell_class, item_class)
+
+
 class TableWithHeaders(object):
   """Represents generic table with headers."""
 
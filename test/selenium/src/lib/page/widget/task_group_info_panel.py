@@ -69,6 +69,24 @@ class TaskGroupInfoPanel(base.WithBrowser):
     return [TaskRow(row, self._table.table_header_names())
             for row in self._root.elements(class_name="object-list__item")]
 
+  def task_obj_dicts(self):
+    """Returns obj dicts of all task rows (see `TaskRow.obj_dict`)."""
+    header_names = self._table.table_header_names()
+    obj_dicts = []
+    for row_cells in table_with_headers.rows_cells(
+        self._browser, row_class="object-list__item",
+        cell_class="task_group_tasks__list-item-column",
+        item_class="tree-field__item"
+    ):
+      cells = dict(zip(header_names, row_cells))
+      initial_setup = cells["Initial Setup"]["text"].split(" - ")
+      obj_dicts.append({
+          "title": cells["Title"]["text"],
+          "assignees": cells["Task Assignees"]["items"],
+          "start_date": initial_setup[0].strip(),
+          "due_date": initial_setup[1].strip()})
+    return obj_dicts
+
   def click_create_task(self):
     """Clicks Create Task button."""
     self._create_task_button.click()
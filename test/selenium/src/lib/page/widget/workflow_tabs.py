@@ -153,6 +153,10 @@ class SetupTab(object_page.ObjectPage):
     """Returns task group rows."""
     return self._task_group_tree.tree_items()
 
+  def task_group_obj_dicts(self):
+    """Returns obj dicts of task group rows."""
+    return self._task_group_tree.obj_dicts()
+
   @property
   def _task_group_panel(self):
     """Returns task group info panel."""
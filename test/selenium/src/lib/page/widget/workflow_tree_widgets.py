@@ -33,3 +33,21 @@ class SetupTaskGroupTree(tree_widget.TreeWidget):
   def __init__(self, container):
     super(SetupTaskGroupTree, self).__init__(
         container=container, table_row_cls=SetupTaskGroupTreeItem)
+
+  def obj_dicts(self):
+    """Returns obj dicts of all task group rows
+    (see `SetupTaskGroupTreeItem.obj_dict`).
+    """
+    self._wait_loading()
+    header_names = self._table.table_header_names()
+    obj_dicts = []
+    for row_cells in table_with_headers.rows_cells(
+        self._root.browser, row_class="tree-item-content",
+        cell_class="attr-content", container=self._root
+    ):
+      cells = dict(zip(header_names, row_cells))
+      obj_dicts.append({
+          "title": cells["Summary"]["text"],
+          "assignee": cells["Assignee"]["text"],
+          "description": cells["Description"]["text"]})
+    return obj_dicts
@@ -18,68 +18,71 @@ def create_workflow(workflow):
   internal_ui_operations.submit_obj(workflow)
 
 
+def _open_setup_tab(workflow):
+  """Opens Setup tab of `workflow` and returns it.
+  Navigation is skipped by `selenium_utils.open_url` if the tab is already
+  opened in the browser.
+  """
+  setup_tab = workflow_tabs.SetupTab()
+  setup_tab.open_via_url(workflow)
+  return setup_tab
+
+
 def open_create_task_group_task_popup(task_group):
   """Opens task group task popup."""
   # pylint: disable=invalid-name
-  setup_tab = workflow_tabs.SetupTab()
-  setup_tab.open_via_url(task_group.workflow)
+  setup_tab = _open_setup_tab(task_group.workflow)
   setup_tab.open_create_task_group_task_modal(task_group)
 
 
 def create_task_group_task(task_group_task):
   """Creates a task group task."""
-  setup_tab = workflow_tabs.SetupTab()
-  setup_tab.open_via_url(task_group_task.task_group.workflow)
+  setup_tab = _open_setup_tab(task_group_task.task_group.workflow)
   setup_tab.create_task_group_task(task_group_task)
 
 
 def task_group_objs(workflow):
   """Returns task group titles of `workflow`."""
-  setup_tab = workflow_tabs.SetupTab()
-  setup_tab.open_via_url(workflow)
-  return [ui_dict_convert.task_group_ui_to_app(task_group_row.obj_dict())
-          for task_group_row in setup_tab.task_group_rows()]
+  setup_tab = _open_setup_tab(workflow)
+  return [ui_dict_convert.task_group_ui_to_app(task_group_dict)
+          for task_group_dict in setup_tab.task_group_obj_dicts()]
 
 
 def get_task_group_tasks_objs():
   """Returns task group tasks."""
-  return [ui_dict_convert.task_group_task_ui_to_app(task_row.obj_dict())
-          for task_row
-          in task_group_info_panel.TaskGroupInfoPanel().task_rows()]
+  return [ui_dict_convert.task_group_task_ui_to_app(task_dict)
+          for task_dict
+          in task_group_info_panel.TaskGroupInfoPanel().task_obj_dicts()]
 
 
 def add_obj_to_task_group(obj, task_group):
   """Map existing object `obj` to the task group `task_group`."""
-  setup_tab = workflow_tabs.SetupTab()
-  setup_tab.open_via_url(task_group.workflow)
+  setup_tab = _open_setup_tab(task_group.workflow)
   setup_tab.add_obj_to_task_group(obj=obj, task_group=task_group)
 
 
 def get_objs_added_to_task_group(task_group):
   """Returns list of objects mapped to the task group."""
-  setup_tab = workflow_tabs.SetupTab()
-  setup_tab.open_via_url(task_group.workflow)
+  setup_tab = _open_setup_tab(task_group.workflow)
   return setup_tab.get_objs_added_to_task_group(task_group)
 
 
 def add_task_group(workflow, task_group):
   """Adds task group."""
-  workflow_tabs.SetupTab().open_via_url(workflow)
+  _open_setup_tab(workflow)
   dashboard.Dashboard().start_task_group()
   object_modal.get_modal_obj("task_group").submit_obj(task_group)
 
 
 def delete_task_group(task_group):
   """Deletes task group."""
-  setup_tab = workflow_tabs.SetupTab()
-  setup_tab.open_via_url(task_group.workflow)
+  setup_tab = _open_setup_tab(task_group.workflow)
   setup_tab.delete_task_group(task_group)
 
 
 def activate_workflow(workflow):
   """Activates workflow."""
-  setup_tab = workflow_tabs.SetupTab()
-  setup_tab.open_via_url(workflow)
+  _open_setup_tab(workflow)
   workflow_page.WorkflowPage().activate_workflow(
       is_workflow_repeat=bool(workflow.repeat_unit))
 
@@ -0,0 +1,140 @@
+# Copyright (C) 2019 Google Inc.
+# Licensed under http://www.apache.org/licenses/LICENSE-2.0 <see LICENSE file>
+
+"""Test MemCache operations on collections."""
+
+from unittest import TestCase
+
+import mock
+
+from appengine import base
+
+from ggrc.cache.memcache import MemCache
+
+
+@base.with_memcache
+class TestMemCache(TestCase):
+  """Test MemCache get/add/update/remove operations."""
+
+  CATEGORY = "collection"
+  RESOURCE = "controls"
+
+  def setUp(self):
+    self.cache = MemCache()
+    self.cache_key = self.cache.get_key(self.CATEGORY, self.RESOURCE)
+
+  def _key(self, id_):
+    """Return memcache key for `id_`."""
+    return "{}:{}".format(self.cache_key, id_)
+
+  def _get(self, ids, attrs=None):
+    """Get entries for `ids` from cache."""
+    return self.cache.get(self.CATEGORY, self.RESOURCE,
+                          {"ids": ids, "attrs": attrs})
+
+  def test_get_all_hit(self):
+    """Test get returns entries of all ids in requested order."""
+    self.memcache_client.set(self._key(1), {"title": "a"})
+    self.memcache_client.set(self._key(2), {"title": "b"})
+    result = self._get([2, 1])
+    self.assertEqual(result.items(),
+                     [(2, {"title": "b"}), (1, {"title": "a"})])
+
+  def test_get_one_missing(self):
+    """Test get returns None if any of ids is missing."""
+    self.memcache_client.set(self._key(1), {"title": "a"})
+    self.assertIsNone(self._get([1, 2]))
+
+  def test_get_duplicate_ids(self):
+    """Test get doesn't treat duplicate ids as missing."""
+    self.memcache_client.set(self._key(1), {"title": "a"})
+    self.assertEqual(dict(self._get([1, 1])), {1: {"title": "a"}})
+
+  def test_get_attrs(self):
+    """Test get returns only requested attrs that exist."""
+    self.memcache_client.set(self._key(1), {"title": "a", "slug": "b"})
+    self.assertEqual(dict(self._get([1], ["title", "missing"])),
+                     {1: {"title": "a"}})
+
+  def test_add_keys(self):
+    """Test add stores each value under its own id key."""
+    data = {1: {"title": "a"}, 2: {"title": "b"}, 3: {"title": "c"}}
+    result = self.cache.add(self.CATEGORY, self.RESOURCE, data)
+    self.assertEqual(result, {1: data, 2: data, 3: data})
+    for id_, value in data.items():
+      self.assertEqual(self.memcache_client.get(self._key(id_)), value)
+
+  def test_add_not_stored(self):
+    """Test add returns None if any absent key isn't stored."""
+    with mock.patch.object(self.cache.memcache_client, "add_multi",
+                           return_value=[self._key(1)]):
+      self.assertIsNone(
+          self.cache.add(self.CATEGORY, self.RESOURCE, {1: {"title": "a"}}))
+
+  def test_add_present_key(self):
+    """Test add replaces present value using CAS."""
+    self.memcache_client.set(self._key(1), {"title": "old"})
+    result = self.cache.add(self.CATEGORY, self.RESOURCE, {1: {"title": "a"}})
+    self.assertIsNotNone(result)
+    self.assertEqual(self.memcache_client.get(self._key(1)), {"title": "a"})
+
+  def test_add_stale_cas(self):
+    """Test add returns None if present value changes after it's fetched."""
+    self.memcache_client.set(self._key(1), {"title": "old"})
+    get_multi = self.cache.memcache_client.get_multi
+
+    def get_multi_and_change(*args, **kwargs):
+      """Fetch values and change one of them to make its CAS id stale."""
+      result = get_multi(*args, **kwargs)
+      self.memcache_client.set(self._key(1), {"title": "changed"})
+      return result
+
+    with mock.patch.object(self.cache.memcache_client, "get_multi",
+                           side_effect=get_multi_and_change):
+      self.assertIsNone(
+          self.cache.add(self.CATEGORY, self.RESOURCE, {1: {"title": "a"}}))
+    self.assertEqual(self.memcache_client.get(self._key(1)),
+                     {"title": "changed"})
+
+  def test_update_after_get(self):
+    """Test update stores values fetched with get before."""
+    self.memcache_client.set(self._key(1), {"title": "old"})
+    self.assertIsNotNone(self._get([1]))
+    data = {1: {"title": "a"}}
+    result = self.cache.update(self.CATEGORY, self.RESOURCE, data, 0)
+    self.assertEqual(result, {1: data})
+    self.assertEqual(self.memcache_client.get(self._key(1)), {"title": "a"})
+
+  def test_update_without_get(self):
+    """Test update returns None for values not fetched with get."""
+    self.memcache_client.set(self._key(1), {"title": "old"})
+    self.assertIsNone(self.cache.update(self.CATEGORY, self.RESOURCE,
+                                        {1: {"title": "a"}}, 0))
+    self.assertEqual(self.memcache_client.get(self._key(1)),
+                     {"title": "old"})
+
+  def test_update_other_instance_get(self):
+    """Test update doesn't use CAS ids fetched by other MemCache."""
+    self.memcache_client.set(self._key(1), {"title": "old"})
+    self.assertIsNotNone(MemCache().get(self.CATEGORY, self.RESOURCE,
+                                        {"ids": [1], "attrs": None}))
+    self.assertIsNone(self.cache.update(self.CATEGORY, self.RESOURCE,
+                                        {1: {"title": "a"}}, 0))
+
+  def test_remove(self):
+    """Test remove deletes present ids and reports absent ones as removed."""
+    self.memcache_client.set(self._key(1), {"title": "a"})
+    self.memcache_client.set(self._key(2), {"title": "b"})
+    data = {1: None, 3: None}
+    result = self.cache.remove(self.CATEGORY, self.RESOURCE, data)
+    self.assertEqual(result, {1: data, 3: data})
+    self.assertIsNone(self.memcache_client.get(self._key(1)))
+    self.assertIsNone(self.memcache_client.get(self._key(3)))
+    self.assertEqual(self.memcache_client.get(self._key(2)), {"title": "b"})
+
+  def test_remove_failure(self):
+    """Test remove returns None if delete_multi fails."""
+    with mock.patch.object(self.cache.memcache_client, "delete_multi",
+                           return_value=False):
+      self.assertIsNone(
+          self.cache.remove(self.CATEGORY, self.RESOURCE, {1: None}))
@@ -7,7 +7,7 @@ from unittest import TestCase
 import mock
 from ddt import data, ddt, unpack
 from appengine import base
-from ggrc.cache.memcache import cached
+from ggrc.cache.memcache import cached, LOCK_SUFFIX
 
 
 @ddt
@@ -36,6 +36,72 @@ class TestMemcacheDecorator(TestCase):
     def test_func():
       pass
     cached_test_func = cached(test_func)
-    cached_test_func.memcache_client.get = mock.Mock(side_effect=['1', None])
-    self.assertEqual(cached_test_func(), '1')
-    self.assertEqual(cached_test_func(), None)
+    with mock.patch.object(cached_test_func.memcache_client, "get",
+                           side_effect=['1', None]):
+      self.assertEqual(cached_test_func(), '1')
+      self.assertEqual(cached_test_func(), None)
+
+  def test_get_key(self):
+    """Test cache key is built from args and name-sorted kwargs"""
+    def test_func(*args, **kwargs):
+      pass
+    cached_test_func = cached(test_func)
+    prefix = "{}.test_func:".format(__name__)
+    self.assertEqual(cached_test_func.get_key(), prefix)
+    self.assertEqual(cached_test_func.get_key(1, "a"), prefix + "1,a")
+    self.assertEqual(
+        cached_test_func.get_key(1, b=2, a=3),
+        prefix + "1,a,3,b,2",
+    )
+
+  def test_call_multi(self):
+    """Test call_multi calculates only values missed in cache"""
+    test_func = mock.Mock(side_effect=lambda a: a * 2)
+    test_func.__name__ = "test_func"
+    cached_test_func = cached(test_func)
+    self.memcache_client.add(cached_test_func.get_key(1), 10)
+    self.assertEqual(cached_test_func.call_multi([(1,), (2,), (2,)]),
+                     [10, 4, 4])
+    test_func.assert_called_once_with(2)
+    self.assertEqual(
+        self.memcache_client.get(cached_test_func.get_key(2)), 4)
+
+  def test_call_multi_cached_none(self):
+    """Test call_multi treats cached None as a miss"""
+    test_func = mock.Mock(return_value=5)
+    test_func.__name__ = "test_func"
+    cached_test_func = cached(test_func)
+    self.memcache_client.add(cached_test_func.get_key(1), None)
+    self.assertEqual(cached_test_func.call_multi([(1,)]), [5])
+    test_func.assert_called_once_with(1)
+
+  @mock.patch('ggrc.cache.memcache.time.sleep')
+  def test_leased_call(self, sleep_mock):
+    """Test call waits for value calculated by lease holder"""
+    test_func = mock.Mock(return_value=1)
+    test_func.__name__ = "test_func"
+    cached_test_func = cached(test_func)
+    key = cached_test_func.get_key()
+    self.memcache_client.add(key + LOCK_SUFFIX, 1)
+    # lease holder stores the value while the caller waits
+    sleep_mock.side_effect = lambda _: self.memcache_client.add(key, 2)
+    self.assertEqual(cached_test_func(), 2)
+    sleep_mock.assert_called_once()
+    test_func.assert_not_called()
+
+  @mock.patch('ggrc.cache.memcache.time.sleep')
+  def test_lease_add_failure(self, sleep_mock):
+    """Test call doesn't wait if lease can't be taken nor read back"""
+    test_func = mock.Mock(return_value=1)
+    test_func.__name__ = "test_func"
+    cached_test_func = cached(test_func)
+    with mock.patch.object(cached_test_func.memcache_client, "add",
+                           return_value=False):
+      self.assertEqual(cached_test_func(), 1)
+    sleep_mock.assert_not_called()
+    test_func.assert_called_once_with()
+
+  def test_shared_client(self):
+    """Test all cached functions share one memcache client"""
+    self.assertIs(cached(lambda: None).memcache_client,
+                  cached(lambda: None).memcache_client)
@@ -5,9 +5,13 @@
 
 import unittest
 
+import ddt
+import mock
+
 from ggrc.models import all_models
 
 
+@ddt.ddt
 class TestStates(unittest.TestCase):
   """Tests for an object states."""
 
@@ -15,11 +19,72 @@ class TestStates(unittest.TestCase):
     """Test task states"""
     self.assertEqual(
         all_models.CycleTaskGroupObjectTask.NO_VALIDATION_STATES,
-        ["Assigned", "In Progress", "Finished", "Deprecated"]
+        ("Assigned", "In Progress", "Finished", "Deprecated")
     )
 
     self.assertEqual(
         all_models.CycleTaskGroupObjectTask.VALID_STATES,
-        ["Assigned", "In Progress", "Finished", "Deprecated", "Verified",
-         "Declined"]
+        ("Assigned", "In Progress", "Finished", "Deprecated", "Verified",
+         "Declined")
     )
+
+  @ddt.data(
+      (True, ("Assigned", "In Progress", "Finished", "Deprecated",
+              "Declined")),
+      (False, ("Assigned", "In Progress", "Deprecated")),
+  )
+  @ddt.unpack
+  def test_task_active_states(self, is_verification_needed, expected):
+    """Test task active states if verification needed is {0}"""
+    with mock.patch(u"ggrc.access_control.role.get_ac_roles_for",
+                    return_value={}):
+      task = all_models.CycleTaskGroupObjectTask(
+          cycle=all_models.Cycle(
+              is_verification_needed=is_verification_needed
+          ),
+      )
+      self.assertEqual(task.active_states, expected)
+
+  def test_task_verification_needed_cycle_change(self):
+    """Test task is_verification_needed follows reassigned cycle"""
+    with mock.patch(u"ggrc.access_control.role.get_ac_roles_for",
+                    return_value={}):
+      task = all_models.CycleTaskGroupObjectTask(
+          cycle=all_models.Cycle(is_verification_needed=True),
+      )
+      self.assertTrue(task.is_verification_needed)
+      task.cycle = all_models.Cycle(is_verification_needed=False)
+      self.assertFalse(task.is_verification_needed)
+
+  def test_task_verification_needed_flag_change(self):
+    """Test task is_verification_needed follows cycle flag change"""
+    with mock.patch(u"ggrc.access_control.role.get_ac_roles_for",
+                    return_value={}):
+      task = all_models.CycleTaskGroupObjectTask(
+          cycle=all_models.Cycle(is_verification_needed=True),
+      )
+      self.assertTrue(task.is_valid_status("Verified"))
+      task.cycle.is_verification_needed = False
+      self.assertFalse(task.is_verification_needed)
+      self.assertFalse(task.is_valid_status("Verified"))
+
+  @ddt.data(
+      (True, "Declined", True),
+      (True, "Verified", True),
+      (False, "Declined", False),
+      (False, "Verified", False),
+      (False, "Finished", True),
+      (True, "Unknown", False),
+  )
+  @ddt.unpack
+  def test_task_is_valid_status(self, is_verification_needed, status,
+                                expected):
+    """Test task status {1} validity if verification needed is {0}"""
+    with mock.patch(u"ggrc.access_control.role.get_ac_roles_for",
+                    return_value={}):
+      task = all_models.CycleTaskGroupObjectTask(
+          cycle=all_models.Cycle(
+              is_verification_needed=is_verification_needed
+          ),
+      )
+      self.assertEqual(task.is_valid_status(status), expected)